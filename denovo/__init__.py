@@ -101,6 +101,11 @@ importables: dict[str, str] = {
 def __getattr__(name: str) -> Any:
     """Lazily imports modules and items within them as package attributes.
     
+    Once imported, the module or item is stored in the package namespace so
+    that later access does not call this function again. Modules which are 
+    still being initialized (as happens with circular imports) are not stored
+    so that a failed import is not cached.
+    
     Args:
         name (str): name of denovo module or item being sought.
 
@@ -111,9 +116,13 @@ def __getattr__(name: str) -> Any:
     package = __package__ or __name__
     key = '.' + importables[name]
     try:
-        return importlib.import_module(key, package = package)
+        imported = importlib.import_module(key, package = package)
     except ModuleNotFoundError:
         item = key.split('.')[-1]
         module_name = key[:-len(item) - 1]
         module = importlib.import_module(module_name, package = package)
-        return getattr(module, item)
+        imported = getattr(module, item)
+    spec = getattr(imported, '__spec__', None)
+    if not getattr(spec, '_initializing', False):
+        globals()[name] = imported
+    return imported
@@ -25,6 +25,9 @@ Contents:
     Module Level Variables:
         BUILTINS (dict): mapping with str names of builtin in a types and values
             as the (generic) type to compare against.
+        BUILTIN_CLASSES (dict): mapping of builtin classes to their str names
+            in BUILTINS, used to identify exact builtin types without any 
+            subclass checks.
         registry (dict): using the module '__getattr__' function, 'registry' 
             acts as a constantly updated registry of Kind subclasses and 
             BUILTINS. Until a tree structure is built for the Kind registry, the 
@@ -56,7 +59,9 @@ import dataclasses
 import datetime
 import functools
 import inspect
+import itertools
 import re
+import types
 from typing import (
     Any, ClassVar, Optional, Type, Union, get_origin, get_type_hints)
 
@@ -88,6 +93,25 @@ BUILTINS: dict[str, Type[Any]] = {
     'bytes': bytes,
     'datetime': datetime.datetime}
 
+# Builtin classes which are matched by identity in 'identify' before any Kind
+# or generic type is tested.
+BUILTIN_CLASSES: dict[Type[Any], str] = {
+    bool: 'bool',
+    str: 'str',
+    float: 'float',
+    int: 'int',
+    complex: 'complex',
+    bytes: 'bytes',
+    datetime.datetime: 'datetime'}
+
+# Results of 'identify' keyed by class. It starts with BUILTIN_CLASSES and is
+# reset whenever the Kind registry changes.
+_identified: dict[Type[Any], str] = dict(BUILTIN_CLASSES)
+
+# Snapshot of (name, type) pairs from the Kind registry followed by BUILTINS,
+# in matching order. It is rebuilt whenever the Kind registry changes.
+_matchers: tuple[tuple[str, Type[Any]], ...] = tuple(BUILTINS.items())
+
 GENERICS: list[Type[Any]] = [
     Callable, #type: ignore
     MutableMapping,
@@ -110,8 +134,7 @@ def __getattr__(attribute: str) -> Any:
     if attribute in ['registry']:
         return get_registry()
     else:
-        raise AttributeError(
-            f'{attribute} not found in {globals()["__module__"]}')    
+        raise AttributeError(f'{attribute} not found in {__name__}')    
 
 def get_registry() -> Types:
     """
@@ -122,6 +145,16 @@ def get_registry() -> Types:
 
 """ Private Methods """
 
+def _reset_identified() -> None:
+    """Clears cached 'identify' results after the Kind registry changes."""
+    global _matchers
+    _identified.clear()
+    _identified.update(BUILTIN_CLASSES)
+    _matchers = tuple(itertools.chain(
+        Kind._registry.items(), BUILTINS.items()))
+    return
+
+@functools.lru_cache(maxsize = None)
 def _snakify(item: str) -> str:
     """Converts a capitalized str to snake case.
 
@@ -146,7 +179,8 @@ class Kind(abc.ABC):
     
     Kind must be subclassed either directly or by using the helper function
     'kindify'. All of its attributes are stored as class-level variables and 
-    subclasses are not designed to be instanced.
+    subclasses are not designed to be instanced. So, subclasses do not need to
+    be dataclasses.
     
     Args:
         attributes (ClassVar[Union[list[str], Types]]): a list of the str names 
@@ -169,7 +203,11 @@ class Kind(abc.ABC):
         _registry (ClassVar[Types]): dict which stores registered Kind 
             subclasses.
     
+    Kind declares empty '__slots__' so that classes which inherit from it (such
+    as denovo containers) are not given a '__dict__' by Kind itself.
+    
     """
+    __slots__ = ()
     attributes: ClassVar[Union[list[str], Types]] = []
     methods: ClassVar[Union[list[str], Signatures]] = []
     properties: ClassVar[list[str]] = []
@@ -181,12 +219,9 @@ class Kind(abc.ABC):
     
     def __init_subclass__(cls, **kwargs: Any):
         """Adds 'cls' to '_registry'."""
-        try:
-            super().__init_subclass__(**kwargs) # type: ignore
-        except AttributeError:
-            pass
-        key = _snakify(cls.__name__)
-        cls._registry[key] = cls
+        super().__init_subclass__(**kwargs) # type: ignore
+        cls._registry[_snakify(cls.__name__)] = cls
+        _reset_identified()
 
     """ Properties """
     
@@ -248,6 +283,7 @@ class Kind(abc.ABC):
         """
         key = name or _snakify(item.__name__)
         cls._registry[key] = item
+        _reset_identified()
         return
         
     """ Dunder Methods """
@@ -255,20 +291,33 @@ class Kind(abc.ABC):
     @classmethod
     def __subclasshook__(cls, subclass: Type[Any]) -> bool:
         """Tests whether 'subclass' has the relevant characteristics."""
-        return is_kind(item = subclass, kind = cls) # type: ignore
+        return (
+            cls in subclass.__mro__ 
+            or is_kind(item = subclass, kind = cls)) # type: ignore
 
 
 def identify(item: Any) -> str:
-    """Determines the kind/type of 'item' and returns its str name."""
+    """Determines the kind/type of 'item' and returns its str name.
+    
+    Subscripted generics (e.g. MutableMapping[str, Any]) are identified by
+    their origin class. Results are cached by class until the Kind registry 
+    changes.
+    
+    """
     if not inspect.isclass(item):
-        item = item.__class__
-    for name, kind in get_registry().items():
+        origin = get_origin(item)
+        item = item.__class__ if origin is None else origin
+    name = _identified.get(item)
+    if name is not None:
+        return name
+    for name, kind in _matchers:
         try:
-            if issubclass(item, kind):
-                return name
+            matched = issubclass(item, kind)
         except TypeError:
-            if issubclass(get_origin(item), kind): # type: ignore
-                return name
+            matched = issubclass(get_origin(item), kind) # type: ignore
+        if matched:
+            _identified[item] = name
+            return name
     raise KeyError(f'item {str(item)} does not match any recognized type')
 
 def is_generic(
@@ -298,23 +347,20 @@ def is_kind(item: Union[Type[Any], object], kind: Kind) -> bool:
              generic = kind.generic,
              contains = kind.contains))
      
+# Base classes used by 'kindify' for every created Kind.
+_KIND_BASES: tuple[Type[Any], ...] = (Kind, abc.ABC)
+
 def kindify(name: str, 
             item: Type[Any], 
             exclude_private: bool = True) -> Type[Kind]:
     """Creates Kind named 'name' from passed 'item'."""
-    kind = dataclasses.make_dataclass(
-        name,
-        list(Kind.__annotations__.keys()), 
-        bases = tuple([Kind, abc.ABC]))
-    kind.attributes = denovo.unit.name_attributes(  # type: ignore
-        item = item,
-        exclude_private = exclude_private)
-    kind.methods = denovo.unit.name_methods( # type: ignore
-        item = item, 
-        exclude_private = exclude_private)
-    kind.properties = denovo.unit.name_properties( # type: ignore
+    kind = types.new_class(name, _KIND_BASES)
+    attributes, methods, properties = denovo.unit.name_traits(
         item = item,
         exclude_private = exclude_private)
+    kind.attributes = attributes # type: ignore
+    kind.methods = methods # type: ignore
+    kind.properties = properties # type: ignore
     for generic in GENERICS:
         if issubclass(item, generic):
             kind.generic = generic # type: ignore
@@ -323,7 +369,6 @@ def kindify(name: str,
 
 """ Base denovo Kinds """
 
-@dataclasses.dataclass
 class Dictionary(Kind):
     
     generic: ClassVar[Optional[Type[Any]]] = MutableMapping
@@ -331,7 +376,6 @@ class Dictionary(Kind):
         Hashable, Any)
 
 
-@dataclasses.dataclass
 class Dyad(Kind):
     
     generic: ClassVar[Optional[Type[Any]]] = tuple
@@ -339,14 +383,12 @@ class Dyad(Kind):
         Sequence, Sequence)
   
 
-@dataclasses.dataclass
 class Group(Kind):
     
     methods: ClassVar[Union[list[str], Signatures]] = ['add', 'subset']
     generic: ClassVar[Optional[Type[Any]]] = Collection
   
 
-@dataclasses.dataclass
 class Named(Kind):
     
     attributes: ClassVar[Union[list[str], Types]] = {'name': str}
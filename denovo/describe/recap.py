@@ -7,7 +7,8 @@ License: Apache-2.0 (https://www.apache.org/licenses/LICENSE-2.0)
 Contents:
     Representation (object): data for a data type's representation.
     kinds (Dict): dictionary of different supported types with Representation
-        instances as values.
+        instances as values. Because '_classify_kind' caches its results by
+        class, '_classified' should be cleared after changing 'kinds'.
     beautify (Callable): provides a pretty str summary for an object. The
         function uses the 'LINE_BREAK' and 'INDENT' module-level items for
         the values for new lines and length of an indentation.
@@ -51,6 +52,10 @@ MAX_LENGTH: int = 20
 INCOMPLETE: str = '...'
 VERTICAL: bool = True
 
+# Results of '_classify_kind' keyed by class. The entries in 'kinds' are all
+# classes, so the matching Representation depends only on an item's class.
+_classified: Dict[Type[Any], Representation] = {}
+
 """ Public Classes """
 
 @dataclasses.dataclass
@@ -281,11 +286,18 @@ def _classify_kind(item: Any) -> Representation:
     """
     if item is None:
         return None
+    key = item.__class__
+    try:
+        return _classified[key]
+    except KeyError:
+        pass
+    for kind, data in kinds.items():
+        if isinstance(item, kind):
+            break
     else:
-        for kind, data in kinds.items():
-            if isinstance(item, kind):
-                return data
-    return kinds[str]
+        data = kinds[str]
+    _classified[key] = data
+    return data
        
 # def _get_textwrapper() -> textwrap.TextWrapper:
 #     """[summary]
@@ -303,7 +315,7 @@ def _classify_kind(item: Any) -> Representation:
     
 """ Module Level Attributes """
 
-kinds: Dict[str, Representation] = {}
+kinds: Dict[Type[Any], Representation] = {}
 kinds[str] = Representation(
     name = 'string',
     method = beautify_string,
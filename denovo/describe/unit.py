@@ -20,6 +20,7 @@ Contents:
         name_attributes
         name_methods
         name_properties
+        name_traits
         is_container
         is_iterable
         is_nested
@@ -193,14 +194,14 @@ def has_methods(
     item: Union[object, Type[Any]], 
     methods: Union[str, list[str]]) -> bool:
     """Returns whether 'item' has 'methods' which are methods."""
-    methods = list(more_itertools.always_iterable(methods))
+    methods = more_itertools.always_iterable(methods)
     return all(is_method(item = item, attribute = m) for m in methods)
 
 def has_properties(
     item: Union[object, Type[Any]], 
     properties: Union[str, list[str]]) -> bool:
     """Returns whether 'item' has 'properties' which are properties."""
-    properties = list(more_itertools.always_iterable(properties))
+    properties = more_itertools.always_iterable(properties)
     return all(is_property(item = item, attribute = p) for p in properties)
 
 def has_signatures(
@@ -270,6 +271,32 @@ def name_properties(
         properties = [p for p in properties if not p.startswith('_')]
     return properties
 
+def name_traits(
+    item: Union[object, Type[Any]], 
+    exclude_private: bool = True) -> tuple[list[str], list[str], list[str]]:
+    """Returns attribute, method, and property names of 'item'.
+    
+    The results match 'name_attributes', 'name_methods', and 'name_properties'
+    but are collected in a single pass over 'dir(item)'.
+    
+    """
+    if inspect.isclass(item):
+        base = item
+    else:
+        base = item.__class__
+    attributes, methods, properties = [], [], []
+    for name in dir(item):
+        if exclude_private and name.startswith('_'):
+            continue
+        value = getattr(item, name)
+        if inspect.ismethod(value):
+            methods.append(name)
+        elif not isinstance(value, property):
+            attributes.append(name)
+        if isinstance(getattr(base, name, None), property):
+            properties.append(name)
+    return attributes, methods, properties
+
 def is_container(item: Union[object, Type[Any]]) -> bool:
     """Return if 'item' is a container."""  
     if not inspect.isclass(item):
@@ -281,8 +308,8 @@ def is_iterable(item: Union[object, Type[Any]]) -> bool:
     if not inspect.isclass(item):
         item = item.__class__ 
     return (
-        issubclass(item, Iterable)  # type: ignore  
-        and not issubclass(item, str)) # type: ignore  
+        not issubclass(item, str) # type: ignore  
+        and issubclass(item, Iterable))  # type: ignore  
     
 def is_nested(item: Mapping[Any, Any]) -> bool:
     """Returns if 'item' is nested at least one-level."""
@@ -294,8 +321,8 @@ def is_sequence(item: Union[object, Type[Any]]) -> bool:
     if not inspect.isclass(item):
         item = item.__class__ 
     return (
-        issubclass(item, Sequence)  # type: ignore  
-        and not issubclass(item, str)) # type: ignore  
+        not issubclass(item, str) # type: ignore  
+        and issubclass(item, Sequence))  # type: ignore  
 
 """ Attribute Introspection Tools """
 
@@ -325,7 +352,7 @@ def is_method(
     attribute: Union[str, types.FunctionType]) -> bool:
     """Returns if 'attribute' is a method of 'item'."""
     if isinstance(attribute, str):
-        attribute = getattr(item, attribute)
+        attribute = getattr(item, attribute, None)
     return inspect.ismethod(attribute)
 
 def is_property(
@@ -335,7 +362,7 @@ def is_property(
     if not inspect.isclass(item):
         item = item.__class__
     if isinstance(attribute, str):
-        attribute = getattr(item, attribute)
+        attribute = getattr(item, attribute, None)
     return isinstance(attribute, property)
 
 """ Container Introspection Tools """
@@ -186,7 +186,7 @@ class FileDistributor(abc.ABC):
             bool: whether 'subclass' is a real or virtual subclass.
             
         """
-        return (subclass in cls.__subclasses__() 
+        return (cls in subclass.__mro__ 
                 or denovo.unit.has_methods(
                     item = subclass,
                     methods = ['transfer']))      
@@ -234,10 +234,10 @@ class FileFormat(denovo.base.Kind):
             bool: whether 'subclass' is a real or virtual subclass.
             
         """
-        return (subclass in cls.__subclasses__() 
+        return (cls in subclass.__mro__ 
                 or denovo.unit.has_attributes(
                     item = subclass,
-                    methods = [
+                    attributes = [
                         'name', 'module', 'extension', 'load_method',
                         'save_method', 'parameters']))
 
@@ -113,13 +113,11 @@ def safe_import(path: str, package: Optional[str] = None) -> Any:
         kwargs = {}
     else:
         kwargs = {'package': package}
-        print('test path package', path, package)
     try: 
         return importlib.import_module(path, **kwargs)
     except (AttributeError, ImportError, ModuleNotFoundError):
         item = path.split('.')[-1]
         new_path = path[:-len(item) - 1]
-        print('test new path item', new_path, item)
         if '.' in new_path:
             _ = safe_import(path = new_path, package = package)
         module = importlib.import_module(new_path, **kwargs)
@@ -219,7 +219,7 @@ class Bunch(denovo.base.Kind, Collection, abc.ABC): # type: ignore
             bool: whether 'subclass' is a real or virtual subclass.
             
         """
-        return (subclass in cls.__subclasses__() 
+        return (cls in subclass.__mro__ 
                 or denovo.unit.has_methods(
                     item = subclass,
                     methods = [
@@ -296,7 +296,7 @@ class Manifest(Bunch, MutableSequence): # type: ignore
                 attribute.
                 
         """
-        if isinstance(item, Sequence) and not isinstance(item, str):
+        if not isinstance(item, str) and isinstance(item, Sequence):
             self.contents.extend(item)
         else:
             self.contents.append(item)
@@ -855,7 +855,7 @@ class Catalog(Lexicon):
         elif key in _NONE_KEYS:
             return []
         # Returns list of matching values if 'key' is list-like.        
-        elif isinstance(key, Sequence) and not isinstance(key, str):
+        elif not isinstance(key, str) and isinstance(key, Sequence):
             return [self.contents[k] for k in key if k in self.contents]
         # Returns matching value if key is not a non-str Sequence or wildcard.
         else:
@@ -920,8 +920,8 @@ class Library(Lexicon):
             defaultdict which autovivifies sets as values.
             
     """
-    classes: Catalog = Catalog()
-    instances: Catalog = Catalog()
+    classes: Catalog = dataclasses.field(default_factory = Catalog)
+    instances: Catalog = dataclasses.field(default_factory = Catalog)
     kinds: MutableMapping[str, set[str]] = dataclasses.field(
         default_factory = lambda: collections.defaultdict(set))
 
@@ -1028,12 +1028,12 @@ class Library(Lexicon):
                 Otherwise, and object is returned.
             
         """
-        names = denovo.convert.listify(name)
+        names = (name,) if isinstance(name, str) else name
         item = None
         for key in names:
-            for catalog in ['instances', 'classes']:
+            for catalog in (self.instances, self.classes):
                 try:
-                    item = getattr(self, catalog)[key]
+                    item = catalog[key]
                     break
                 except KeyError:
                     pass
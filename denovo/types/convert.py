@@ -48,7 +48,8 @@ from typing import Any, Callable, Optional, Type, Union
 import more_itertools
 
 import denovo
-from denovo.base import Adjacency, Dyad, Edges, Matrix, Pipeline
+from denovo.core.base import Dyad
+from denovo.types.structures import Adjacency, Edges, Matrix, Pipeline
 
 
 """ Class Related Tools """
@@ -119,7 +120,7 @@ def listify(item: Any, default: Optional[Any] = None) -> Any:
             return None
         else:
             return default
-    elif isinstance(item, MutableSequence) and not isinstance(item, str):
+    elif not isinstance(item, str) and isinstance(item, MutableSequence):
         return item
     else:
         return [item]
@@ -298,13 +299,9 @@ def to_adjacency(source: Any) -> Adjacency:
 @to_adjacency.register # type: ignore
 def edges_to_adjacency(source: Edges) -> Adjacency:
     """Converts and edge list to an adjacency list."""
-    print('test edges', source)
     adjacency = collections.defaultdict(set)
     for edge_pair in source:
-        if edge_pair[0] not in adjacency:
-            adjacency[edge_pair[0]] = {edge_pair[1]}
-        else:
-            adjacency[edge_pair[0]].add(edge_pair[1])
+        adjacency[edge_pair[0]].add(edge_pair[1])
         if edge_pair[1] not in adjacency:
             adjacency[edge_pair[1]] = set()
     return adjacency
@@ -330,10 +327,9 @@ def matrix_to_adjacency(source: Matrix) -> Adjacency:
 @to_adjacency.register # type: ignore 
 def pipeline_to_adjacency(source: Pipeline) -> Adjacency:
     """Converts a Pipeline to an Adjacency."""
-    adjacency = collections.defaultdict(set)
-    edges = more_itertools.windowed(source, 2)
-    for edge_pair in edges:
-        adjacency[edge_pair[0]] = {edge_pair[1]}
+    adjacency = collections.defaultdict(set, {node: set() for node in source})
+    for edge_pair in more_itertools.pairwise(source):
+        adjacency[edge_pair[0]].add(edge_pair[1])
     return adjacency
 
 @denovo.dynamic.dispatcher   
@@ -359,7 +355,7 @@ def to_dict(source: Any) -> denovo.base.Dictionary:
 @to_dict.register # type: ignore   
 def dyad_to_dict(source: Dyad) -> denovo.base.Dictionary:
     """Converts a Dyad to a MutableMapping."""
-    return dict(zip(source))
+    return dict(zip(source[0], source[1]))
 
 @denovo.dynamic.dispatcher   
 def to_dyad(source: Any) -> Dyad:
@@ -384,7 +380,7 @@ def to_dyad(source: Any) -> Dyad:
 @to_dyad.register # type: ignore
 def dict_to_dyad(source: MutableMapping) -> Dyad:
     """Converts a MutableMapping to a Dyad."""
-    return zip(*source)
+    return (tuple(source.keys()), tuple(source.values()))
 
 @denovo.dynamic.dispatcher   
 def to_edges(source: Any) -> Edges:
@@ -412,7 +408,7 @@ def adjacency_to_edges(source: Adjacency) -> Edges:
     edges = []
     for node, connections in source.items():
         for connection in connections:
-            edges.append(tuple(node, connection))
+            edges.append((node, connection))
     return edges
 
 @denovo.dynamic.dispatcher   
@@ -529,14 +525,24 @@ def to_matrix(source: Any) -> Matrix:
 
 @to_matrix.register # type: ignore 
 def adjacency_to_matrix(source: Adjacency) -> Matrix:
-    """Converts an Adjacency to a Matrix."""
-    names = list(source.keys())
-    matrix = []
-    for i in range(len(source)): 
-        matrix.append([0] * len(source))
-        for j in source[i]:
-            matrix[i][j] = 1
-    return tuple(matrix, names)
+    """Converts an Adjacency to a Matrix.
+    
+    Nodes that only appear as edge stops are added after the keys of 'source'
+    so that every edge has a row and column in the returned Matrix.
+    
+    """
+    indices = {name: i for i, name in enumerate(source)}
+    for stops in source.values():
+        for stop in stops:
+            if stop not in indices:
+                indices[stop] = len(indices)
+    names = list(indices)
+    matrix = [[0] * len(names) for _ in names]
+    for start, stops in source.items():
+        row = matrix[indices[start]]
+        for stop in stops:
+            row[indices[stop]] = 1
+    return (matrix, names)
 
 @denovo.dynamic.dispatcher   
 def to_float(source: Any) -> float:
@@ -5,6 +5,7 @@ Copyright 2020-2021, Corey Rayburn Yung
 License: Apache-2.0 (https://www.apache.org/licenses/LICENSE-2.0)
 
 Contents:
+    quirks (dict): registry of concrete Quirk subclasses.
     Quirk (ABC): base class for quirks.
     Named (Quirk, Kind, ABC): base class that requires a 'name' attribute and, 
         if inherited, automatically provides a value for 'name'.
@@ -14,6 +15,7 @@ Contents:
         Type in 'sources' class variable}"
     Importer (Quirk): quirk that supports lazy importation of modules and items 
         stored within them.
+    Logger (Quirk): quirk that provides a 'logger' named after the subclass.
 
 ToDo:
     Fix quirks which are currently commented out.
@@ -24,14 +26,22 @@ from __future__ import annotations
 import abc
 from collections.abc import Mapping
 import dataclasses
-from typing import Any, ClassVar, Optional, Type
+import logging
+from typing import Any, Callable, ClassVar, Optional, Type
 
 import denovo
 
+""" Module Level Variables """
+
+# Registry of concrete Quirk subclasses.
+quirks: dict[str, Type[Quirk]] = {}
+# Bound once so that registering a subclass does not resolve 'denovo.modify'.
+_snakify = denovo.modify.snakify
+
 """ Mixin Base Class 
 
 To add mixins to denovo classes, you do not need to subclass Quirk. Doing so 
-only automatically adds the mixin to the mixin registry at Quirk.registry.
+only automatically adds the mixin to the mixin registry at 'quirks'.
 
 denovo Quirks are not technically mixins because some have required 
 attributes. Traditionally, mixins do not have any attributes and only add 
@@ -45,31 +55,44 @@ because their design and goals are otherwise similar to mixins.
 class Quirk(abc.ABC):
     """Base class for denovo quirks (mixin-approximations).
 
+    Quirk declares empty '__slots__' so that it does not add a '__dict__' to
+    its subclasses. Subclasses must also declare '__slots__' for their 
+    instances to be created without a '__dict__'.
+
+    Args:
+        _snake_name (ClassVar[str]): snakecase name of the class, computed once
+            when the class is created.
+        _concrete (ClassVar[bool]): whether the class is concrete, meaning that
+            'abc.ABC' is not one of its direct bases. It is computed once when 
+            the class is created so that subclasses can check it cheaply.
  
-    Namespaces: __init_subclass__
+    Namespaces: __init_subclass__, _concrete, _snake_name
     
     """
+    __slots__ = ()
+    _snake_name: ClassVar[str] = 'quirk'
+    _concrete: ClassVar[bool] = False
     
     """ Initialization Methods """
     
     def __init_subclass__(cls, **kwargs: Any) -> None:
         """Adds 'cls' to 'quirks' if it is a concrete class."""
         super().__init_subclass__(**kwargs) # type: ignore
+        # Stores the snakecase class name so that it is only computed once.
+        cls._snake_name = _snakify(cls.__name__)
+        cls._concrete = abc.ABC not in cls.__bases__
         # Adds concrete quirks to 'quirks' using 'key'.
-        if not abc.ABC in cls.__bases__:
-            # Creates a snakecase key of the class name.
-            key = denovo.modify.snakify(cls.__name__)
+        if cls._concrete:
+            key = cls._snake_name
             # Removes "_quirk" from class name if you choose to use 'Quirk' as
             # a suffix to Quirk subclasses. denovo doesn't follow this practice 
             # but includes this adjustment for users that which to use that 
             # naming convention and don't want to type "_quirk" at the end of
             # a key when accessing 'quirks'.
-            try:
-                key = key.replace('_quirk', '')
-            except ValueError:
-                pass
+            if key.endswith('_quirk'):
+                key = key[:-len('_quirk')]
             # Stores 'cls' in 'quirks'.
-            denovo.base.quirks[key] = cls
+            quirks[key] = cls
 
 """ Naming Mixin """
 
@@ -86,24 +109,34 @@ class Namer(Quirk, abc.ABC):
             instance needs settings from a settings instance, 'name' should 
             match the appropriate section name in a settings instance. 
             Defaults to None. 
+        _has_super_post_init (ClassVar[bool]): whether a class after Namer in
+            the method resolution order has a '__post_init__' method. It is set
+            when a subclass is created so that instancing does not depend on
+            catching an AttributeError. 
             
-    Namespaces: _get_name
+    Namespaces: _get_name, _has_super_post_init
 
     """
     name: Optional[str] = None
+    _has_super_post_init: ClassVar[bool] = False
     
     """ Initialization Methods """
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Stores whether a later class in the MRO has '__post_init__'."""
+        super().__init_subclass__(**kwargs) # type: ignore
+        later = cls.__mro__[cls.__mro__.index(Namer) + 1:]
+        cls._has_super_post_init = any(
+            '__post_init__' in vars(base) for base in later)
 
     def __post_init__(self) -> None:
         """Initializes class instance attributes."""
         # sets 'name' attribute.
-        if not hasattr(self, 'name') or self.name is None:  
+        if getattr(self, 'name', None) is None:  
             self.name = self._get_name()
         # Calls parent and/or mixin initialization method(s).
-        try:
+        if self._has_super_post_init:
             super().__post_init__() # type: ignore
-        except AttributeError:
-            pass
 
     """ Private Methods """
     
@@ -117,7 +150,7 @@ class Namer(Quirk, abc.ABC):
             str: name of class for internal referencing and some access methods.
         
         """
-        return denovo.modify.snakify(self.__class__.__name__) # type: ignore
+        return self.__class__._snake_name
     
     """ Dunder Methods """
     
@@ -132,7 +165,7 @@ class Namer(Quirk, abc.ABC):
             bool: whether 'subclass' is a real or virtual subclass.
             
         """
-        return (subclass in cls.__subclasses__() or hasattr(subclass, 'name'))
+        return cls in subclass.__mro__ or hasattr(subclass, 'name')
 
 """ Factory Constructor Mixin """
 
@@ -145,12 +178,50 @@ class Factory(Quirk, abc.ABC):
             data sources for object creation. For the appropriate creation
             classmethod to be called, the types need to match the type of the
             first argument passed.
+        _creators (ClassVar[tuple[tuple[Type[Any], str, Optional[Callable[
+            ..., Factory]]], ...]]): the types, suffixes, and creation methods 
+            derived from 'sources'. It is built once when a subclass is created
+            so that 'create' does not need to look up methods on every call. A
+            method is None only for an abstract subclass that lacks it.
+        _dispatch (ClassVar[dict[Type[Any], tuple[tuple[str, Optional[
+            Callable[..., Factory]]], ...]]]): cache with keys that are the 
+            types of sources previously passed to 'create' and values that are 
+            the matching suffixes and creation methods in the order they are 
+            tried. 
     
-    Namespaces: create, sources, _get_create_method_name       
+    Namespaces: create, sources, _creators, _dispatch, _match_creators, 
+        _get_create_method_name
     
     """
+    __slots__ = ()
     sources: ClassVar[Mapping[Type[Any], str]] = {}
+    _creators: ClassVar[tuple[
+        tuple[Type[Any], str, Optional[Callable[..., Factory]]], ...]] = ()
+    _dispatch: ClassVar[dict[Type[Any], tuple[
+        tuple[str, Optional[Callable[..., Factory]]], ...]]] = {}
     
+    """ Initialization Methods """
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Stores the creation methods derived from 'sources'.
+        
+        Raises:
+            AttributeError: if a concrete subclass lacks a creation method for
+                a value in 'sources'.
+                
+        """
+        super().__init_subclass__(**kwargs) # type: ignore
+        creators = []
+        for kind, suffix in cls.sources.items():
+            method_name = cls._get_create_method_name(item = suffix)
+            method = getattr(cls, method_name, None)
+            if method is None and cls._concrete:
+                raise AttributeError(f'{method_name} does not exist')
+            creators.append((kind, suffix, method))
+        cls._creators = tuple(creators)
+        # Each subclass gets its own cache because its 'sources' may differ.
+        cls._dispatch = {}
+        
     """ Class Methods """
 
     @classmethod
@@ -172,22 +243,42 @@ class Factory(Quirk, abc.ABC):
             Factory: instance of a Factory.
             
         """
-        for kind, suffix in cls.sources.items():
-            if isinstance(source, kind):
+        # Matches for a type are found once and then cached.
+        kind = type(source)
+        matches = cls._dispatch.get(kind)
+        if matches is None:
+            matches = cls._dispatch[kind] = cls._match_creators(kind = kind)
+        for suffix, method in matches:
+            if method is None:
                 method_name = cls._get_create_method_name(item = suffix)
-                try:
-                    method = getattr(cls, method_name)
-                except AttributeError:
-                    raise AttributeError(f'{method_name} does not exist')
-                kwargs[suffix] = source
-                try:
-                    return method(**kwargs)
-                except ValueError:
-                    del kwargs[suffix]
-                    kwargs['source'] = source
+                raise AttributeError(f'{method_name} does not exist')
+            kwargs[suffix] = source
+            try:
+                return method(**kwargs)
+            except ValueError:
+                del kwargs[suffix]
+                kwargs['source'] = source
         raise ValueError(
             f'source does not match any recognized types in sources attribute')
         
+    @classmethod
+    def _match_creators(cls, kind: Type[Any]) -> tuple[
+            tuple[str, Optional[Callable[..., Factory]]], ...]:
+        """Returns suffixes and creation methods for sources of type 'kind'.
+        
+        Args:
+            kind (Type[Any]): type of a source passed to 'create'.
+            
+        Returns:
+            tuple[tuple[str, Optional[Callable[..., Factory]]], ...]: matching
+                suffixes and creation methods in the order of 'sources'.
+                
+        """
+        return tuple(
+            (suffix, method) 
+            for source_kind, suffix, method in cls._creators
+            if issubclass(kind, source_kind))
+        
     @classmethod
     def _get_create_method_name(cls, item: str) -> str:
         """Returns classmethod name for creating an instance.
@@ -207,6 +298,55 @@ converted from the str to the lazily imported object and permantent stored in
 place of the previous str value.
 
 """
+class _ImportPath(object):
+    """Descriptor that imports a stored import path on first access.
+
+    Args:
+        name (str): name of the attribute managed by the descriptor.
+        default (Any): class-level value of the attribute, if any. Defaults to
+            dataclasses.MISSING.
+            
+    """
+    __slots__ = ('name', 'default')
+    
+    def __init__(self, name: str, default: Any = dataclasses.MISSING) -> None:
+        self.name = name
+        self.default = default
+
+    def __get__(self, instance: Any, owner: Type[Any]) -> Any:
+        """Returns the stored value, importing it if it is an import path."""
+        if instance is None:
+            if self.default is dataclasses.MISSING:
+                raise AttributeError(self.name)
+            return self.default
+        stored = instance.__dict__
+        value = stored.get(self.name, self.default)
+        if value is dataclasses.MISSING:
+            raise AttributeError(self.name)
+        if type(value) is str and '.' in value:
+            failed = stored.get('_failed_imports')
+            if failed is None or failed.get(self.name) is not value:
+                try:
+                    imported = denovo.lazy.safe_import(path = value)
+                except (AttributeError, ImportError, ValueError):
+                    # Records 'value' so that the import is not attempted 
+                    # again. ValueError is raised for strings which are not 
+                    # import paths, such as a file suffix like '.csv'.
+                    stored.setdefault('_failed_imports', {})[self.name] = value
+                else:
+                    stored[self.name] = value = imported
+        return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        instance.__dict__[self.name] = value
+
+    def __delete__(self, instance: Any) -> None:
+        try:
+            del instance.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name)
+
+        
 @dataclasses.dataclass
 class Importer(Quirk, abc.ABC):
     """Faciliates lazy importing from modules.
@@ -215,38 +355,73 @@ class Importer(Quirk, abc.ABC):
     (indicated by having a '.' in their text) will automatically have those
     attribute values turned into the corresponding stored classes.
 
-    Subclasses should not have custom '__getattribute__' methods or properties
-    to avoid errors. If a subclass absolutely must include a custom 
-    '__getattribute__' method, it should incorporate the code from this class.
+    Only annotated attributes and class attributes that store import paths are
+    checked. When a subclass is created, each of those attributes is given a
+    descriptor that performs the import, so any other attribute access (such as
+    methods) uses Python's normal lookup without a custom '__getattribute__'.
+    A path that cannot be imported is recorded in the instance's 
+    '_failed_imports' so that the import is not attempted again for that value.
 
-    Namespaces: '__getattribute__'
+    Subclasses should not replace those attributes with properties or other
+    descriptors to avoid errors. Importer itself adds no '__dict__', but its
+    subclasses need one because converted values are stored there.
+            
+    Namespaces: '_failed_imports'
     
     """
+    __slots__ = ()
 
-    """ Dunder Methods """
+    """ Initialization Methods """
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Adds import descriptors to attributes that may store import paths.
+        
+        Descriptors on base classes are inherited, so only names annotated or
+        assigned in 'cls' itself are wrapped.
+        
+        """
+        super().__init_subclass__(**kwargs) # type: ignore
+        candidates = set(cls.__dict__.get('__annotations__', {}))
+        candidates.update(
+            k for k, v in cls.__dict__.items() 
+            if isinstance(v, str) and '.' in v)
+        for name in candidates:
+            default = cls.__dict__.get(name, dataclasses.MISSING)
+            if isinstance(default, (dataclasses.Field, _ImportPath)):
+                continue
+            setattr(cls, name, _ImportPath(name = name, default = default))
+        
+""" Logging Quirk """
+
+@dataclasses.dataclass
+class Logger(Quirk, abc.ABC):
+    """Provides a logger named after the module and name of a subclass.
 
-    def __getattribute__(self, attribute: str) -> Any:
-        """Converts stored import paths into the corresponding objects.
+    The logger is looked up once when a subclass is created and stored on the
+    class, so accessing 'logger' is a plain attribute read.
 
-        If an import path is stored, that attribute is permanently converted
-        from a str to the imported object or class.
+    Args:
+        _logger (ClassVar[logging.Logger]): logger for the class.
         
-        Args:
-            attribute (str): name of attribute sought.
+    Namespaces: logger, _logger
+    
+    """
+    __slots__ = ()
+    _logger: ClassVar[logging.Logger] = logging.getLogger(__name__)
 
-        Returns:
-            Any: the stored value or, if the value is an import path, the
-                class or object stored at the designated import path.
-            
-        """
-        value = super().__getattribute__(attribute)
-        if isinstance(value, str) and '.' in value:
-            try:
-                value = denovo.load.acquire(path = value)
-                super().__setattr__(attribute, value)
-            except ImportError:
-                pass
-        return value
+    """ Initialization Methods """
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Stores a logger named after 'cls' in '_logger'."""
+        super().__init_subclass__(**kwargs) # type: ignore
+        cls._logger = logging.getLogger(f'{cls.__module__}.{cls.__name__}')
+        
+    """ Properties """
+    
+    @property
+    def logger(self) -> logging.Logger:
+        """Returns the logger for the class of this instance."""
+        return self.__class__._logger
    
 # """ Subclass and Instance Registration Quirk """
 
@@ -273,6 +448,7 @@ class Importer(Quirk, abc.ABC):
 #     Namespaces: library, __init_subclass__, __post_init__
     
 #     """
+#     __slots__ = ()
 #     library: ClassVar[denovo.Library] = denovo.Library()
     
 #     """ Initialization Methods """
@@ -281,7 +457,7 @@ class Importer(Quirk, abc.ABC):
 #         """Adds 'cls' to 'library'."""
 #         super().__init_subclass__(**kwargs)
 #         # Adds concrete subclasses to 'library'.
-#         if not abc.ABC in cls.__bases__:
+#         if cls._concrete:
 #             if Keystone in cls.__bases__:
 #                 base = denovo.unit.get_name(item = cls)
 #             else:
@@ -341,7 +517,7 @@ class Importer(Quirk, abc.ABC):
 #             if need not in kwargs and need not in ['self']:
 #                 raise ValueError(f'The create method must include a {need} '
 #                                  f'argument')
-#         return method(**kwargs: Any)      
+#         return method(**kwargs)      
     
 #     @classmethod
 #     def parameterize(cls, instance: object) -> Mapping[str, Any]:
@@ -378,14 +554,6 @@ class Importer(Quirk, abc.ABC):
 #         return kwargs
 
 
-# @dataclasses.dataclass
-# class Logger(Quirk):
-    
-#     @property
-#     def logger(self):
-#         name = f'{self.__module__}.{self.__class__.__name__}'
-#         return logging.getLogger(name)
-
 # @dataclasses.dataclass
 # class Proxified(object):
 #     """ which creates a proxy name for a Named subclass attribute.
@@ -19,12 +19,10 @@ Classes:
             composite objects with directed edges. There is no value in 
             inheriting from Directed except to enforce the subclass 
             requirements.
-    Graph (Bunch): a lightweight directed acyclic graph (DAG) that serves as
-        the base class for denovo composite structures. Internally, the graph is
-        stored as an adjacency list. As a result, it should primarily be used
-        for workflows or other uses that do form large graphs. In those
-        instances, an adjacency matrix would be far more efficient.
-    System (Graph): a lightweight directed acyclic graph (DAG). Internally, the 
+        Graph (Directed, ABC): base class establishing criteria for denovo 
+            composite objects that can be created from and exported to 
+            adjacency lists and matrices.
+    System (Lexicon): a lightweight directed acyclic graph (DAG). Internally, the 
         graph is stored as an adjacency list. As a result, it should primarily 
         be used for workflows or other uses that do require large graphs.
     Type Variables:
@@ -48,20 +46,25 @@ To Do:
 from __future__ import annotations
 import abc
 import collections
-from collections.abc import Collection, Hashable, MutableMapping, Sequence
+from collections.abc import (
+    Collection, Hashable, Iterator, MutableMapping, Sequence)
 import collections.abc
-import copy
 import dataclasses
-import itertools
+import functools
 from typing import Any, Callable, ClassVar, Optional, Type, Union
 
 import more_itertools
 
 import denovo
 
+""" Module Level Variables """
+
+# Bound once so that 'System._stringify' and 'Nodifier' do not resolve 
+# 'denovo.modify' on each call. 'denovo.modify.snakify' caches its results.
+_snakify = denovo.modify.snakify
+
 """ Composite-Related Kinds """
 
-@dataclasses.dataclass
 class Node(denovo.base.Kind):
     
     methods: ClassVar[Union[list[str], denovo.base.Signatures]] = [
@@ -69,7 +72,6 @@ class Node(denovo.base.Kind):
     generic: ClassVar[Optional[Type[Any]]] = Hashable
 
 
-@dataclasses.dataclass
 class Composite(denovo.base.Kind):
     
     methods: ClassVar[Union[list[str], denovo.base.Signatures]] = [
@@ -77,14 +79,12 @@ class Composite(denovo.base.Kind):
     properties: ClassVar[list[str]] = ['nodes']
 
 
-@dataclasses.dataclass
 class Connections(denovo.base.Kind):
     
     generic: ClassVar[Optional[Type[Any]]] = Collection
     contains: ClassVar[Optional[Union[Any, tuple[Any, ...]]]] = Node
 
 
-@dataclasses.dataclass
 class Network(Composite):
     
     methods: ClassVar[Union[list[str], denovo.base.Signatures]] = [
@@ -92,7 +92,6 @@ class Network(Composite):
     properties: ClassVar[list[str]] = ['edges']
 
 
-@dataclasses.dataclass
 class Directed(Network):
     
     methods: ClassVar[Union[list[str], denovo.base.Signatures]] = [
@@ -100,7 +99,6 @@ class Directed(Network):
     properties: ClassVar[list[str]] = ['endpoints', 'paths', 'roots']
 
 
-@dataclasses.dataclass
 class Graph(Directed):
     
     methods: ClassVar[Union[list[str], denovo.base.Signatures]] = [
@@ -108,7 +106,6 @@ class Graph(Directed):
     properties: ClassVar[list[str]] = ['adjacency', 'matrix']
 
 
-@dataclasses.dataclass
 class Adjacency(denovo.base.Kind):
     
     generic: ClassVar[Optional[Type[Any]]] = MutableMapping
@@ -116,35 +113,30 @@ class Adjacency(denovo.base.Kind):
         str, Connections)
 
 
-@dataclasses.dataclass
 class Edge(denovo.base.Kind):
     
     generic: ClassVar[Optional[Type[Any]]] = tuple
     contains: ClassVar[Optional[Union[Any, tuple[Any, ...]]]] = (Node, Node)
 
 
-@dataclasses.dataclass
 class Edges(denovo.base.Kind):
     
     generic: ClassVar[Optional[Type[Any]]] = tuple
     contains: ClassVar[Optional[Union[Any, tuple[Any, ...]]]] = (Edge)
     
 
-@dataclasses.dataclass
 class Labels(denovo.base.Kind):
     
     generic: ClassVar[Optional[Type[Any]]] = Sequence
     contains: ClassVar[Optional[Union[Any, tuple[Any, ...]]]] = str
 
 
-@dataclasses.dataclass
 class RowColumn(denovo.base.Kind):
     
     generic: ClassVar[Optional[Type[Any]]] = Sequence
     contains: ClassVar[Optional[Union[Any, tuple[Any, ...]]]] = int
     
     
-@dataclasses.dataclass
 class RawMatrix(denovo.base.Kind):
     
     generic: ClassVar[Optional[Type[Any]]] = tuple
@@ -152,7 +144,6 @@ class RawMatrix(denovo.base.Kind):
         RowColumn, RowColumn)
     
     
-@dataclasses.dataclass
 class Matrix(denovo.base.Kind):
     
     generic: ClassVar[Optional[Type[Any]]] = tuple
@@ -160,14 +151,12 @@ class Matrix(denovo.base.Kind):
         RawMatrix, Labels)
 
 
-@dataclasses.dataclass
 class Pipeline(denovo.base.Kind):
     
     generic: ClassVar[Optional[Type[Any]]] = Sequence
     contains: ClassVar[Optional[Union[Any, tuple[Any, ...]]]] = Node
 
 
-@dataclasses.dataclass
 class Pipelines(denovo.base.Kind):
     
     generic: ClassVar[Optional[Type[Any]]] = Collection
@@ -199,6 +188,7 @@ class Nodifier(Hashable, abc.ABC):
     """
     contents: Optional[Any] = None
     name: Optional[str] = None
+    _snake_name: ClassVar[str] = 'nodifier'
 
     """ Initialization Methods """
     
@@ -210,18 +200,17 @@ class Nodifier(Hashable, abc.ABC):
         classes.
         
         """
-        try:
-            super().__init_subclass__(*args, **kwargs) # type: ignore
-        except AttributeError:
-            pass
+        super().__init_subclass__(*args, **kwargs) # type: ignore
         cls.__hash__ = Node.__hash__ # type: ignore
         cls.__eq__ = Node.__eq__ # type: ignore
         cls.__ne__ = Node.__ne__ # type: ignore
+        # Stores the snakecase class name so that it is only computed once.
+        cls._snake_name = _snakify(cls.__name__)
 
     def __post_init__(self) -> None:
         """Initializes class instance attributes."""
         # Sets 'name' attribute if 'name' is None.
-        self.name = self.name or denovo.modify.snakify(self.__class__.__name__)
+        self.name = self.name or self.__class__._snake_name
                 
     """ Dunder Methods """
 
@@ -348,111 +337,6 @@ class Nodifier(Hashable, abc.ABC):
         
 """ """
 
-@dataclasses.dataclass # type: ignore
-class Graph(object):
-    """Base class for denovo graph data structures.
-    
-    Args:
-        contents (Union[Adjacency, Matrix]): an adjacency list or adjacency
-            matrix storing the contained graph.
-                  
-    """  
-    contents: Union[Adjacency, Matrix] # type: ignore
-    
-    """ Required Properties """
-
-    @abc.abstractproperty
-    def adjacency(self) -> Adjacency:
-        """Returns the stored graph as an adjacency list."""
-        pass
-
-    @abc.abstractproperty
-    def matrix(self) -> Matrix:
-        """Returns the stored graph as an adjacency matrix."""
-        pass
-    
-    """ Required Methods """
-    
-    @abc.abstractclassmethod
-    def from_adjacency(cls, adjacency: Adjacency) -> Graph:
-        """Creates a Graph instance from an Adjacency instance."""
-        pass
-    
-    @abc.abstractclassmethod
-    def from_edges(cls, edges: Edges) -> Graph:
-        """Creates a Graph instance from an Edges instance."""
-        pass
-    
-    @abc.abstractclassmethod
-    def from_matrix(cls, matrix: Matrix) -> Graph:
-        """Creates a Graph instance from a Matrix instance."""
-        pass
-    
-    @abc.abstractclassmethod
-    def from_pipeline(cls, pipeline: Pipeline) -> Graph:
-        """Creates a Graph instance from a Pipeline instance."""
-        pass
-
-    """ Public Methods """
-    
-    @classmethod
-    def create(cls, source: Composite) -> Graph:
-        """Creates an instance of a Graph from 'source'.
-        
-        Args:
-            source (Composite): an adjacency list, adjacency matrix, edge list, 
-                or pipeline which can used to create the stored graph.
-                
-        Returns:
-            Graph: a Graph instance created based on 'source'.
-                
-        """
-        if denovo.tools.is_adjacency_list(item = source):
-            return cls.from_adjacency(adjacency = source) # type: ignore
-        elif denovo.tools.is_adjacency_matrix(item = source):
-            return cls.from_matrix(matrix = source) # type: ignore
-        elif denovo.tools.is_edge_list(item = source):
-            return cls.from_edges(edges = source) # type: ignore
-        elif denovo.tools.is_pipeline(item = source): 
-            return cls.from_pipeline(pipeline = source) # type: ignore
-        else:
-            raise TypeError(
-                f'create requires source to be an adjacency list, adjacency '
-                f'matrix, edge list, or pipeline')      
-      
-    """ Dunder Methods """
-
-    @classmethod
-    def __subclasshook__(cls, subclass: Type[Any]) -> bool:
-        """Returns whether 'subclass' is a virtual or real subclass.
-
-        Args:
-            subclass (Type[Any]): item to test as a subclass.
-
-        Returns:
-            bool: whether 'subclass' is a real or virtual subclass.
-            
-        """
-        return (super().__subclasshook__(subclass = subclass) 
-                and denovo.unit.has_methods(item = subclass,
-                                             methods = ['from_adjacency',
-                                                        'from_edges',
-                                                        'from_matrix',
-                                                        'from_pipeline'])
-                and denovo.unit.has_properties(item = subclass,
-                                                attributes = ['adjacency',
-                                                              'matrix']))
-        
-    def __str__(self) -> str:
-        """Returns prettier str representation of the stored graph.
-
-        Returns:
-            str: a formatted str of class information and the contained graph.
-            
-        """
-        return denovo.recap.beautify(item = self, package = 'denovo') # type: ignore
- 
-  
 @dataclasses.dataclass
 class System(denovo.containers.Lexicon):
     """Base class for denovo directed graphs.
@@ -480,7 +364,7 @@ class System(denovo.containers.Lexicon):
     @property
     def edges(self) -> Edges:
         """Returns the stored graph as an edge list."""
-        return denovo.tools.adjacency_to_edges(source = self.contents)
+        return denovo.convert.adjacency_to_edges(source = self.contents)
 
     @property
     def endpoints(self) -> set[Node]:
@@ -490,7 +374,7 @@ class System(denovo.containers.Lexicon):
     @property
     def matrix(self) -> Matrix:
         """Returns the stored graph as an adjacency matrix."""
-        return denovo.tools.adjacency_to_matrix(source = self.contents)
+        return denovo.convert.adjacency_to_matrix(source = self.contents)
                       
     @property
     def nodes(self) -> set[Node]:
@@ -500,13 +384,45 @@ class System(denovo.containers.Lexicon):
     @property
     def paths(self) -> Pipelines:
         """Returns all paths through the stored graph as Pipeline."""
-        return self._find_all_paths(starts = self.roots, stops = self.endpoints)
+        return list(self._find_all_paths(
+            starts = self.roots, 
+            stops = self.endpoints))
        
     @property
     def roots(self) -> set[Node]:
         """Returns root nodes in the stored graph in a list."""
-        stops = list(itertools.chain.from_iterable(self.contents.values()))
-        return {k for k in self.contents.keys() if k not in stops}
+        stops = set().union(*self.contents.values())
+        return self.contents.keys() - stops
+
+    @property
+    def topological_order(self) -> Pipeline:
+        """Returns all nodes in an order in which every edge points forward.
+        
+        The order is found with Kahn's algorithm in a single pass over the 
+        stored graph, so it is much cheaper than 'paths' when only an execution
+        order is needed.
+
+        Raises:
+            ValueError: if the stored graph contains a cycle.
+            
+        """
+        contents = self.contents
+        counts = dict.fromkeys(contents, 0)
+        for descendants in contents.values():
+            for node in descendants:
+                counts[node] = counts.get(node, 0) + 1
+        ready = collections.deque(n for n, c in counts.items() if c == 0)
+        order = []
+        while ready:
+            node = ready.popleft()
+            order.append(node)
+            for descendant in contents.get(node, ()):
+                counts[descendant] -= 1
+                if counts[descendant] == 0:
+                    ready.append(descendant)
+        if len(order) < len(counts):
+            raise ValueError('topological_order requires an acyclic graph')
+        return order
     
     """ Class Methods """
  
@@ -518,19 +434,19 @@ class System(denovo.containers.Lexicon):
     @classmethod
     def from_edges(cls, edges: Edges) -> System:
         """Creates a System instance from an edge list."""
-        return cls(contents = denovo.tools.edges_to_adjacency(
+        return cls(contents = denovo.convert.edges_to_adjacency(
             source = edges))
     
     @classmethod
     def from_matrix(cls, matrix: Matrix) -> System:
         """Creates a System instance from an adjacency matrix."""
-        return cls(contents = denovo.tools.matrix_to_adjacency(
+        return cls(contents = denovo.convert.matrix_to_adjacency(
             source = matrix))
     
     @classmethod
     def from_pipeline(cls, pipeline: Pipeline) -> System:
         """Creates a System instance from a Pipeline."""
-        return cls(contents = denovo.tools.pipeline_to_adjacency(
+        return cls(contents = denovo.convert.pipeline_to_adjacency(
             source = pipeline))
        
     """ Public Methods """
@@ -599,9 +515,10 @@ class System(denovo.containers.Lexicon):
         if isinstance(item, Composite):
             current_endpoints = list(self.endpoints)
             new_graph = self.create(source = item)
+            new_roots = new_graph.roots
             self.merge(item = new_graph)
             for endpoint in current_endpoints:
-                for root in new_graph.roots:
+                for root in new_roots:
                     self.connect(start = endpoint, stop = root)
         else:
             raise TypeError('item must be a System, Adjacency, Edges, '
@@ -622,12 +539,14 @@ class System(denovo.containers.Lexicon):
         if start == stop:
             raise ValueError('The start of an edge cannot be the same as the '
                              'stop in a System because it is acyclic')
-        elif start not in self:
-            self.add(node = start)
-        elif stop not in self:
-            self.add(node = stop)
-        if stop not in self.contents[start]:
-            self.contents[start].add(self._stringify(stop))
+        if type(stop) is not str:
+            stop = self._stringify(stop)
+        contents = self.contents
+        if start not in contents:
+            contents[start] = set()
+        if stop not in contents:
+            contents[stop] = set()
+        contents[start].add(stop)
         return
 
     def delete(self, node: Node) -> None:
@@ -644,7 +563,8 @@ class System(denovo.containers.Lexicon):
             del self.contents[node]
         except KeyError:
             raise KeyError(f'{node} does not exist in the graph')
-        self.contents = {k: v.discard(node) for k, v in self.contents.items()}
+        for descendants in self.contents.values():
+            descendants.discard(node)
         return
 
     def disconnect(self, start: Node, stop: Node) -> None:
@@ -667,35 +587,30 @@ class System(denovo.containers.Lexicon):
     def merge(self, item: Union[Composite]) -> None:
         """Adds 'item' to this Graph.
 
-        This method is roughly equivalent to a dict.update, just adding the
-        new keys and values to the existing graph. It converts 'item' to an 
-        adjacency list that is then added to the existing 'contents'.
+        It converts 'item' to an adjacency list that is then added to the 
+        existing 'contents'. Nodes already in the stored graph keep their edges
+        and gain any new ones from 'item'. Edges are copied so that later 
+        changes to this graph do not alter 'item'.
         
         Args:
             item (Union[Composite]): another Graph, an adjacency list, an 
-                edge list, an adjacency matrix, or one or more nodes.
+                edge list, a pipeline, or one or more nodes.
             
         Raises:
-            TypeError: if 'item' is neither a System, Adjacency, Edges, Matrix, 
-                or Nodes type.
+            TypeError: if 'item' is neither a System, Adjacency, Edges, 
+                Pipeline, or Nodes type.
             
         """
-        if isinstance(item, System):
-            adjacency = item.adjacency
-        elif isinstance(item, Adjacency):
-            adjacency = item
-        elif isinstance(item, Edges):
-            adjacency = denovo.tools.edges_to_adjacency(source = item)
-        elif isinstance(item, Matrix):
-            adjacency = denovo.tools.matrix_to_adjacency(source = item)
-        elif isinstance(item, (list, tuple, set)):
-            adjacency = denovo.tools.pipeline_to_adjacency(source = item)
-        elif isinstance(item, Node):
-            adjacency = {item: set()}
+        if type(item) is System:
+            adjacency = item.contents
         else:
-            raise TypeError('item must be a System, Adjacency, Edges, '
-                            'Matrix, Pipeline, or Node type')
-        self.contents.update(adjacency)
+            adjacency = _to_adjacency(item)
+        contents = self.contents
+        for node, descendants in adjacency.items():
+            if node in contents:
+                contents[node].update(descendants)
+            else:
+                contents[node] = set(descendants)
         return
 
     def prepend(self, item: Union[Composite]) -> None:
@@ -716,9 +631,10 @@ class System(denovo.containers.Lexicon):
         if isinstance(item, Composite):
             current_roots = list(self.roots)
             new_graph = self.create(source = item)
+            new_endpoints = new_graph.endpoints
             self.merge(item = new_graph)
             for root in current_roots:
-                for endpoint in new_graph.endpoints:
+                for endpoint in new_endpoints:
                     self.connect(start = endpoint, stop = root)
         else:
             raise TypeError('item must be a System, Adjacency, Edges, '
@@ -734,7 +650,8 @@ class System(denovo.containers.Lexicon):
         the new subgraph.
         
         Any extra attributes that are part of a System (or a subclass) will be
-        maintained in the returned subgraph.
+        maintained in the returned subgraph. Only the adjacency list is copied,
+        so stored nodes and other attributes are shared with this instance.
 
         Args:
             include (Union[Any, Sequence[Any]]): nodes which should be included
@@ -748,16 +665,17 @@ class System(denovo.containers.Lexicon):
         """
         if include is None and exclude is None:
             raise ValueError('Either include or exclude must not be None')
-        else:
-            if include:
-                excludables = [k for k in self.contents if k not in include]
-            else:
-                excludables = []
-            excludables.extend([i for i in self.contents if i in exclude])
-            new_graph = copy.deepcopy(self)
-            for node in more_itertools.always_iterable(excludables):
-                new_graph.delete(node = node)
-        return new_graph
+        # Key views accept any iterable, so 'include' and 'exclude' are not
+        # copied into sets first.
+        excludables = set()
+        if include:
+            excludables.update(self.contents.keys() - _iterify(include))
+        if exclude:
+            excludables.update(self.contents.keys() & _iterify(exclude))
+        contents = {
+            k: {n for n in v if n not in excludables} 
+            for k, v in self.contents.items() if k not in excludables}
+        return dataclasses.replace(self, contents = contents)
     
     def walk(self, 
              start: Node, 
@@ -765,7 +683,10 @@ class System(denovo.containers.Lexicon):
              path: Optional[Pipeline] = None) -> Pipeline:
         """Returns all paths in graph from 'start' to 'stop'.
 
-        The code here is adapted from: https://www.python.org/doc/essays/graphs/
+        The graph is searched depth-first with an explicit stack rather than
+        recursion. A single working path is extended and shortened as the
+        search advances and backtracks, and a set of the nodes in it is kept
+        for constant-time checks that a node is not revisited.
         
         Args:
             start (Node): node to start paths from.
@@ -778,28 +699,63 @@ class System(denovo.containers.Lexicon):
                 nodes) from 'start' to 'stop'.
             
         """
-        if path is None:
-            path = []
-        path = path + [start]
+        path = [] if path is None else list(path)
+        path.append(start)
         if start == stop:
             return [path]
-        if start not in self.contents:
-            return []
+        contents = self.contents
         paths = []
-        for node in self.contents[start]:
-            if node not in path:
-                new_paths = self.walk(
-                    start = node, 
-                    stop = stop, 
-                    path = path)
-                for new_path in new_paths:
-                    paths.append(new_path)
+        visited = set(path)
+        # Each item in 'stack' iterates the descendants of the node at the 
+        # same position in 'path'.
+        stack = [iter(contents.get(start, ()))]
+        while stack:
+            for node in stack[-1]:
+                if node in visited:
+                    continue
+                elif node == stop:
+                    paths.append(path + [node])
+                elif node in contents:
+                    path.append(node)
+                    visited.add(node)
+                    stack.append(iter(contents[node]))
+                    break
+            else:
+                stack.pop()
+                visited.discard(path.pop())
         return paths
 
     """ Private Methods """
 
-    def _find_all_paths(self, starts: Nodes, stops: Nodes) -> Pipeline:
-        """Returns all paths between 'starts' and 'stops'.
+    def _stringify(self, node: Any) -> Node:
+        """Returns the key used to store 'node' in 'contents'.
+
+        Hashable nodes are their own keys. Otherwise, the key is the node's 
+        'name' attribute or, if it has none, the snakecase name of the node 
+        (if it is a class) or of its class.
+        
+        Args:
+            node (Any): node to convert to a key.
+
+        Returns:
+            Node: key for 'node'.
+            
+        """
+        if type(node) is str or isinstance(node, Hashable):
+            return node
+        name = getattr(node, 'name', None)
+        if name is None:
+            name = _snakify(getattr(node, '__name__', node.__class__.__name__))
+        return name
+
+    def _find_all_paths(
+        self, 
+        starts: Nodes, 
+        stops: Nodes) -> Iterator[Pipeline]:
+        """Yields all paths between 'starts' and 'stops'.
+
+        Paths are yielded as each start and stop pair is traced, so callers 
+        that only need some of the paths can stop early.
 
         Args:
             start (Union[Node, Sequence[Node]]): starting points for 
@@ -807,21 +763,71 @@ class System(denovo.containers.Lexicon):
             ends (Union[Node, Sequence[Node]]): endpoints for paths 
                 through the System.
 
+        Yields:
+            Pipeline: each path through the System from all 'starts' to all 
+                'ends'.
+            
+        """
+        stops = _iterify(stops)
+        # Paths to each end from nodes already traced are shared across starts.
+        memos = {}
+        for start in _iterify(starts):
+            for end in stops:
+                memo = memos.setdefault(end, {})
+                paths = self._trace(start = start, stop = end, memo = memo)
+                if paths is None:
+                    paths = self.walk(start = start, stop = end)
+                yield from paths
+
+    def _trace(self, 
+               start: Node, 
+               stop: Node, 
+               memo: dict[Node, Pipelines]) -> Optional[Pipelines]:
+        """Returns all paths from 'start' to 'stop' using stored subpaths.
+
+        Every node reached from 'start' has its paths to 'stop' stored in 
+        'memo', so later calls with the same 'stop' and 'memo' reuse them 
+        rather than searching the same part of the graph again. The paths are
+        returned in the same order as 'walk' returns them.
+        
+        Args:
+            start (Node): node to start paths from.
+            stop (Node): node to stop paths.
+            memo (dict[Node, Pipelines]): paths to 'stop' from nodes that have
+                already been traced.
+
         Returns:
-            Pipeline: list of all paths through the System from all 'starts' 
-                to all 'ends'.
+            Optional[Pipelines]: a list of possible paths (each path is a list 
+                of nodes) from 'start' to 'stop' or None if a cycle is found.
             
         """
-        all_paths = []
-        for start in more_itertools.always_iterable(starts):
-            for end in more_itertools.always_iterable(stops):
-                paths = self.walk(start = start, stop = end)
-                if paths:
-                    if all(isinstance(path, Node) for path in paths):
-                        all_paths.append(paths)
-                    else:
-                        all_paths.extend(paths)
-        return all_paths
+        # Items in 'stack' are nodes paired with whether their descendants 
+        # have already been traced.
+        contents = self.contents
+        stack = [(start, False)]
+        active = set()
+        while stack:
+            node, traced = stack.pop()
+            if traced:
+                active.discard(node)
+                memo[node] = [
+                    [node] + path 
+                    for descendant in contents[node] 
+                    for path in memo[descendant]]
+            elif node in memo:
+                continue
+            elif node == stop:
+                memo[node] = [[node]]
+            elif node not in contents:
+                memo[node] = []
+            elif node in active:
+                return None
+            else:
+                active.add(node)
+                stack.append((node, True))
+                stack.extend(
+                    (d, False) for d in contents[node] if d not in memo)
+        return memo[start]
     
     """ Dunder Methods """
 
@@ -848,6 +854,71 @@ class System(denovo.containers.Lexicon):
         return 
 
 
+""" Private Functions """
+
+def _iterify(item: Any) -> Collection[Any]:
+    """Returns 'item' as a collection of nodes.
+    
+    Builtin collections are returned as they are. Anything else is handled
+    like 'more_itertools.always_iterable', with the result stored in a tuple so
+    that it can be iterated more than once.
+    
+    Args:
+        item (Any): a node, a collection of nodes, or None.
+        
+    Returns:
+        Collection[Any]: 'item' or the nodes in it.
+        
+    """
+    if type(item) in (list, tuple, set, frozenset):
+        return item
+    return tuple(more_itertools.always_iterable(item))
+
+@functools.singledispatch
+def _to_adjacency(item: Any) -> Adjacency:
+    """Returns 'item' as an adjacency list for 'System.merge'.
+    
+    The converter is chosen by the type of 'item' with a single dispatch 
+    lookup. Because the Kinds used for graphs are matched by class, a tuple is
+    always treated as Edges.
+
+    Args:
+        item (Any): another System, an adjacency list, an edge list, a pipeline,
+            or a node.
+        
+    Raises:
+        TypeError: if 'item' is neither a System, Adjacency, Edges, Pipeline, 
+            or Node type.
+            
+    Returns:
+        Adjacency: an adjacency list derived from 'item'.
+    
+    """
+    raise TypeError('item must be a System, Adjacency, Edges, Pipeline, or '
+                    'Node type')
+
+@_to_adjacency.register(System)
+def _system_to_adjacency(item: System) -> Adjacency:
+    return item.adjacency
+
+@_to_adjacency.register(MutableMapping)
+def _mapping_to_adjacency(item: Adjacency) -> Adjacency:
+    return item
+
+@_to_adjacency.register(tuple)
+def _tuple_to_adjacency(item: Edges) -> Adjacency:
+    return denovo.convert.edges_to_adjacency(source = item)
+
+@_to_adjacency.register(list)
+@_to_adjacency.register(set)
+def _sequence_to_adjacency(item: Pipeline) -> Adjacency:
+    return denovo.convert.pipeline_to_adjacency(source = item)
+
+@_to_adjacency.register(Hashable)
+def _node_to_adjacency(item: Node) -> Adjacency:
+    return {item: set()}
+
+
 
 # @dataclasses.dataclass
 # class Network(Graph):
@@ -1163,8 +1234,8 @@ class System(denovo.containers.Lexicon):
 #             del self.contents[node]
 #         except KeyError:
 #             raise KeyError(f'{node} does not exist in the graph')
-#         self.contents = {
-#             k: v.remove(node) for k, v in self.contents.items() if node in v}
+#         for descendants in self.contents.values():
+#             descendants.discard(node)
 #         return
 
 #     def disconnect(self, start: Node, stop: Node) -> None:
@@ -20,6 +20,7 @@ ToDo:
 from __future__ import annotations
 import dataclasses
 import functools
+import inspect
 from typing import Any, Callable, Type, Union, get_type_hints
 
 
@@ -95,21 +96,34 @@ class dispatcher(object):
         key = _identify(item = item)
         return self.registry[key](*args, **kwargs)
     
-    def register(self, wrapped: Callable[..., Any]) -> None:
+    def register(self, wrapped: Callable[..., Any]) -> Callable[..., Any]:
         """Adds 'wrapped' to 'registry' based on type of its first parameter.
 
         Args:
             wrapped (Callable[..., Any]): wrapped callable.
             
+        Returns:
+            Callable[..., Any]: 'wrapped' unchanged so that it can still be 
+                called directly after being decorated.
+            
         """
         _, annotation = next(iter(get_type_hints(wrapped).items()))
         key = _identify(item = annotation)
         self.registry[key] = wrapped
-        return
+        return wrapped
 
 def _identify(item: Any) -> str:
-    """Determines the kind/type of 'item' and returns its str name."""
+    """Determines the kind/type of 'item' and returns its str name.
+    
+    Types which are not recognized by 'denovo.base.identify' (such as NoneType)
+    are keyed by their class name.
+    
+    """
     # Local import as workaround for circular import.
     import denovo
-    return denovo.base.identify(item = item)
+    try:
+        return denovo.base.identify(item = item)
+    except KeyError:
+        kind = item if inspect.isclass(item) else type(item)
+        return kind.__name__
     # return 'list'
\ No newline at end of file
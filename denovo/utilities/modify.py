@@ -28,6 +28,7 @@ from __future__ import annotations
 
 from collections.abc import Mapping, MutableSequence, Sequence, Set
 import dataclasses
+import functools
 import re
 from typing import Any, Type
 
@@ -893,9 +894,13 @@ def capitalify(item: str) -> str:
     """
     return item.replace('_', ' ').title().replace(' ', '')
 
+@functools.lru_cache(maxsize = 256)
 def snakify(item: str) -> str:
     """Converts a capitalized str to snake case.
 
+    Recent results are cached because 'snakify' is mostly called on class 
+    names. The cache is bounded because 'snakify' accepts any str.
+
     Args:
         item (str): str to convert.
 
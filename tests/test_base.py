@@ -0,0 +1,34 @@
+"""
+test_base: tests functions and classes in denovo.base
+Corey Rayburn Yung <coreyrayburnyung@gmail.com>
+Copyright 2020-2021, Corey Rayburn Yung
+License: Apache-2.0 (https://www.apache.org/licenses/LICENSE-2.0)
+
+ToDo:
+    
+"""
+from collections.abc import MutableMapping
+import datetime
+from typing import Any
+
+import denovo
+
+
+def test_identify() -> None:
+    assert denovo.base.identify(item = 3) == 'int'
+    assert denovo.base.identify(item = True) == 'bool'
+    assert denovo.base.identify(item = 'something') == 'str'
+    assert denovo.base.identify(item = 2.5) == 'float'
+    assert denovo.base.identify(item = datetime.datetime.now()) == 'datetime'
+    assert denovo.base.identify(item = int) == 'int'
+    assert (
+        denovo.base.identify(item = list[int]) 
+        == denovo.base.identify(item = list))
+    assert (
+        denovo.base.identify(item = MutableMapping[str, Any]) 
+        == denovo.base.identify(item = MutableMapping))
+    return
+
+if __name__ == '__main__':
+    denovo.test.testify(target_module = denovo.base, testing_module = __name__)
+    
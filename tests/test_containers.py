@@ -7,7 +7,6 @@ License: Apache-2.0 (https://www.apache.org/licenses/LICENSE-2.0)
 ToDo:
     test_catalog: complete tests
     test_proxy
-    test_library
     
 """
 import dataclasses
@@ -88,6 +87,17 @@ def test_lexicon():
 def test_catalog():
     catalog = denovo.Catalog()
     return
+
+def test_library():
+    manifest = denovo.containers.Manifest
+    library = denovo.containers.Library()
+    library.deposit(item = manifest)
+    instance = TestClass()
+    library.deposit(item = instance)
+    assert library.withdraw(name = 'manifest') is manifest
+    assert library.withdraw(name = ['missing', 'manifest']) is manifest
+    assert library.withdraw(name = 'something') is instance
+    return
  
 if __name__ == '__main__':
     denovo.test.testify(target_module = denovo.containers, 
@@ -0,0 +1,41 @@
+"""
+test_convert: tests functions in denovo.convert
+Corey Rayburn Yung <coreyrayburnyung@gmail.com>
+Copyright 2020-2021, Corey Rayburn Yung
+License: Apache-2.0 (https://www.apache.org/licenses/LICENSE-2.0)
+"""
+import denovo
+
+
+def test_dyad_to_dict() -> None:
+    dyad = (('a', 'b', 'c'), (1, 2, 3))
+    assert denovo.convert.dyad_to_dict(source = dyad) == {
+        'a': 1, 'b': 2, 'c': 3}
+    return
+
+def test_dict_to_dyad() -> None:
+    dictionary = {'a': 1, 'b': 2, 'c': 3}
+    dyad = denovo.convert.dict_to_dyad(source = dictionary)
+    assert dyad == (('a', 'b', 'c'), (1, 2, 3))
+    assert denovo.convert.dyad_to_dict(source = dyad) == dictionary
+    return
+
+def test_edges_to_adjacency() -> None:
+    edges = [('a', 'b'), ('b', 'c')]
+    adjacency = denovo.convert.edges_to_adjacency(source = edges)
+    assert adjacency == {'a': {'b'}, 'b': {'c'}, 'c': set()}
+    assert sorted(denovo.convert.adjacency_to_edges(source = adjacency)) == (
+        edges)
+    return
+
+def test_pipeline_to_adjacency() -> None:
+    adjacency = denovo.convert.pipeline_to_adjacency(source = ['a', 'b', 'c'])
+    assert adjacency == {'a': {'b'}, 'b': {'c'}, 'c': set()}
+    assert denovo.convert.pipeline_to_adjacency(source = ['a']) == {
+        'a': set()}
+    return
+
+
+if __name__ == '__main__':
+    denovo.test.testify(target_module = denovo.convert,
+                        testing_module = __name__)
@@ -4,6 +4,7 @@ Corey Rayburn Yung <coreyrayburnyung@gmail.com>
 Copyright 2020-2021, Corey Rayburn Yung
 License: Apache-2.0 (https://www.apache.org/licenses/LICENSE-2.0)
 """
+import dataclasses
 import sys
 from typing import (Any, Callable, ClassVar, Dict, Hashable, Iterable, Mapping, 
                     MutableMapping, MutableSequence, Optional, Sequence, Type, 
@@ -13,9 +14,9 @@ import denovo
 
 
 @dataclasses.dataclass
-class Bases(denovo.core.quirks.Importer):
+class Bases(denovo.quirks.Importer):
     
-    clerk: Union[str, Type] = denovo.filing.Clerk
+    clerk: Union[str, Type] = 'denovo.filing.Clerk'
     library: Union[str, Type] = 'denovo.containers.Library'
     settings: Union[str, Type] = 'denovo.configuration.settings'
     
@@ -28,6 +29,23 @@ def test_importer():
     assert isinstance(clerk, denovo.filing.Clerk)
     return
 
+@dataclasses.dataclass
+class Paths(denovo.quirks.Importer):
+    
+    importer: Union[str, Type] = 'denovo.files.lazy.safe_import'
+    suffix: str = '.csv'
+    
+
+def test_importer_paths() -> None:
+    paths = Paths()
+    assert paths.importer is denovo.lazy.safe_import
+    assert '_failed_imports' not in vars(paths)
+    assert paths.suffix == '.csv'
+    assert vars(paths)['_failed_imports'] == {'suffix': '.csv'}
+    assert paths == Paths()
+    assert 'suffix' in repr(paths)
+    return
+
 if __name__ == '__main__':
     testables = denovo.test.get_testables(module = denovo.quirks)
     denovo.test.run_tests(testables = testables, 
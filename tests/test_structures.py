@@ -27,6 +27,94 @@ class EvenAnother(denovo.structures.Node):
     pass
 
 
+def test_merge() -> None:
+    system = denovo.structures.System(contents = {'a': {'b'}, 'b': set()})
+    system.merge(item = {'c': {'a'}})
+    system.merge(item = 'd')
+    assert system.contents == {'a': {'b'}, 'b': set(), 'c': {'a'}, 'd': set()}
+    other = denovo.structures.System(contents = {'a': {'d'}, 'd': set()})
+    system.merge(item = other)
+    assert system.contents['a'] == {'b', 'd'}
+    assert other.contents['a'] == {'d'}
+    system = denovo.structures.System(contents = {'a': set()})
+    system.merge(item = (('a', 'b'), ('b', 'c')))
+    assert system.contents == {'a': {'b'}, 'b': {'c'}, 'c': set()}
+    system.merge(item = ['c', 'd'])
+    assert system.contents['c'] == {'d'}
+    assert system.contents['d'] == set()
+    return
+
+def test_roots() -> None:
+    system = denovo.structures.System(contents = {
+        'a': {'b', 'c'}, 'b': {'d'}, 'c': {'d'}, 'd': set(), 'e': set()})
+    assert system.roots == {'a', 'e'}
+    assert system.endpoints == {'d', 'e'}
+    assert denovo.structures.System().roots == set()
+    return
+
+def test_connect() -> None:
+    system = denovo.structures.System(contents = {'a': set(), 'b': set()})
+    system.connect(start = 'a', stop = 'b')
+    assert system.contents == {'a': {'b'}, 'b': set()}
+    system.connect(start = 'c', stop = 'd')
+    assert system.contents == {'a': {'b'}, 'b': set(), 'c': {'d'}, 'd': set()}
+    return
+
+def test_delete() -> None:
+    system = denovo.structures.System(contents = {
+        'a': {'b', 'c'}, 'b': {'d'}, 'c': {'d'}, 'd': set()})
+    system.delete(node = 'b')
+    assert system.contents == {'a': {'c'}, 'c': {'d'}, 'd': set()}
+    return
+
+def test_subset() -> None:
+    system = denovo.structures.System(contents = {
+        'a': {'b', 'c'}, 'b': {'d'}, 'c': {'d'}, 'd': set()})
+    subgraph = system.subset(include = ['a', 'b', 'd'], exclude = 'd')
+    assert subgraph.contents == {'a': {'b'}, 'b': set()}
+    assert system.contents['a'] == {'b', 'c'}
+    return
+
+def test_topological_order() -> None:
+    system = denovo.structures.System(contents = {
+        'd': set(), 'c': {'d'}, 'b': {'d', 'e'}, 'a': {'b', 'c'}})
+    order = system.topological_order
+    assert sorted(order) == ['a', 'b', 'c', 'd', 'e']
+    for start, stops in system.contents.items():
+        for stop in stops:
+            assert order.index(start) < order.index(stop)
+    return
+
+def test_walk() -> None:
+    system = denovo.structures.System(contents = {
+        'a': {'b', 'c'}, 'b': {'d'}, 'c': {'d'}, 'd': set()})
+    paths = system.walk(start = 'a', stop = 'd')
+    assert sorted(paths) == [['a', 'b', 'd'], ['a', 'c', 'd']]
+    assert system.walk(start = 'd', stop = 'a') == []
+    assert system.walk(start = 'b', stop = 'b') == [['b']]
+    return
+
+def test_paths() -> None:
+    system = denovo.structures.System(contents = {
+        'a': {'c'}, 'b': {'c'}, 'c': {'d', 'e'}, 'd': set(), 'e': set()})
+    assert sorted(system.paths) == [
+        ['a', 'c', 'd'], ['a', 'c', 'e'], ['b', 'c', 'd'], ['b', 'c', 'e']]
+    return
+
+def test_conversions() -> None:
+    system = denovo.structures.System(contents = {
+        'a': {'b'}, 'b': {'c'}, 'c': set()})
+    assert sorted(system.edges) == [('a', 'b'), ('b', 'c')]
+    assert system.matrix == ([[0, 1, 0], [0, 0, 1], [0, 0, 0]], 
+                             ['a', 'b', 'c'])
+    System = denovo.structures.System
+    assert System.from_edges(edges = system.edges).contents == system.contents
+    assert System.from_matrix(matrix = system.matrix).contents == (
+        system.contents)
+    assert System.from_pipeline(pipeline = ['a', 'b', 'c']).contents == (
+        system.contents)
+    return
+
 
 if __name__ == '__main__':
     denovo.test.testify(target_module = denovo.structures,